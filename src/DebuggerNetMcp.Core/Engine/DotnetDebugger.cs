@@ -1,4 +1,5 @@
 using System.Diagnostics;
+using System.Globalization;
 using System.Linq;
 using System.Runtime.InteropServices;
 using System.Runtime.InteropServices.Marshalling;
@@ -35,18 +36,30 @@ public sealed class DotnetDebugger : IAsyncDisposable
     private uint _attachPid;
     private int _nextBreakpointId = 1;
 
+    // Session state as a SessionState value. Kept as an int so it can be read and written
+    // atomically from any MCP tool thread (tool instances are per-call; the debugger is the singleton).
+    private int _state = (int)SessionState.Idle;
+
     // dotnet test vstest runner process (kept alive while testhost is being debugged)
     private System.Diagnostics.Process? _dotnetTestProcess;
 
+    // Background reader that drains the runner's stdout after the testhost PID has been parsed.
+    // Completes on its own once the runner exits and the pipe reaches EOF.
+    private Task? _dotnetTestOutputDrain;
+
+    // Upper bound on waiting for a killed vstest runner to exit and its stdout to reach EOF.
+    private static readonly TimeSpan TestRunnerExitTimeout = TimeSpan.FromSeconds(2);
+
     // PID of the vstest testhost process (spawned by dotnet test with VSTEST_HOST_DEBUG=1).
     // Stored separately because the testhost is NOT a Linux child of _dotnetTestProcess,
     // so Kill(entireProcessTree: true) on the runner does not kill it. Must be killed by PID.
     private uint _testhostPid;
 
-    // Pending breakpoints: set before the module loads
-    private readonly List<PendingBreakpoint> _pendingBreakpoints = new();
+    // Pending breakpoints: set before the module loads, by breakpoint ID
+    private readonly Dictionary<int, PendingBreakpoint> _pendingBreakpoints = new();
 
-    // Active breakpoints: ICorDebugFunctionBreakpoint instances by ID
+    // Active breakpoints: ICorDebugFunctionBreakpoint instances by ID.
+    // Guarded by _bpLock: resolved on the LoadModule callback thread as well as the debug thread.
     private readonly Dictionary<int, ICorDebugFunctionBreakpoint> _activeBreakpoints = new();
 
     // Loaded modules: module name -> ICorDebugModule
@@ -59,15 +72,21 @@ public sealed class DotnetDebugger : IAsyncDisposable
     // "add to pending" step in SetBreakpointAsync, causing the pending BP to never activate.
     private readonly object _bpLock = new();
 
+    // Stack frames already resolved during the current stop, by thread ID. Walking a stack costs
+    // a PDB reverse lookup per frame, and debug_stacktrace is typically called again with
+    // debug_variables at the same stop. Debug thread only; cleared whenever the debuggee resumes.
+    private readonly Dictionary<uint, List<StackFrameInfo>> _stackFrameCache = new();
+
+    // Locals of the active frame already read during the current stop, by thread ID. Same
+    // lifetime as _stackFrameCache: nothing can change a value while the debuggee is stopped.
+    private readonly Dictionary<uint, List<VariableInfo>> _localsCache = new();
+
+    // vstest prints "Process Id: 12345, Name: testhost" when VSTEST_HOST_DEBUG=1.
+    private const string TesthostPidMarker = "Process Id:";
+
     public DotnetDebugger(string? dbgShimPath = null)
     {
-        // Event channel: single writer (callback thread), multiple readers (MCP tools)
-        _eventChannel = Channel.CreateUnbounded<DebugEvent>(new UnboundedChannelOptions
-        {
-            SingleWriter = true,
-            SingleReader = false,
-            AllowSynchronousContinuations = false  // CRITICAL: prevents deadlock
-        });
+        _eventChannel = CreateEventChannel();
 
         // Command channel: MCP tool threads enqueue work; _debugThread executes it
         _commandChannel = Channel.CreateUnbounded<Action>(new UnboundedChannelOptions
@@ -93,6 +112,33 @@ public sealed class DotnetDebugger : IAsyncDisposable
         _debugThread.Start();
     }
 
+    // Event channel: single writer (callback thread), multiple readers (MCP tools).
+    // The options never change, so one instance is shared by every session's channel
+    // (the channel copies the flags at creation and never mutates them).
+    private static readonly UnboundedChannelOptions EventChannelOptions = new()
+    {
+        SingleWriter = true,
+        SingleReader = false,
+        AllowSynchronousContinuations = false  // CRITICAL: prevents deadlock
+    };
+
+    // Recreated for every session so a completed channel from the previous run is never reused.
+    private static Channel<DebugEvent> CreateEventChannel() =>
+        Channel.CreateUnbounded<DebugEvent>(EventChannelOptions);
+
+    /// <summary>
+    /// Current session state. Lives on the debugger rather than on the MCP tool class because
+    /// the tool class is instantiated per call, while the debugger is shared by every call.
+    /// The engine owns every transition: Running when the debuggee is resumed, Stopped/Exited
+    /// when the matching event is consumed via WaitForEventAsync, Idle on disconnect.
+    /// Safe to read from any thread.
+    /// </summary>
+    public SessionState State
+    {
+        get => (SessionState)Volatile.Read(ref _state);
+        private set => Volatile.Write(ref _state, (int)value);
+    }
+
     // -----------------------------------------------------------------------
     // Public API — Launch, Attach, Disconnect
     // -----------------------------------------------------------------------
@@ -105,9 +151,17 @@ public sealed class DotnetDebugger : IAsyncDisposable
     /// <param name="projectPath">Path to the .csproj or directory containing one.</param>
     /// <param name="appDllPath">Path to the compiled .dll to run (e.g. bin/Debug/net9.0/App.dll).</param>
     /// <param name="ct">Cancellation token.</param>
+    /// <param name="skipBuildIfUpToDate">
+    /// Skip <c>dotnet build</c> when <paramref name="appDllPath"/> is newer than every .cs and
+    /// project file under the project directory. This is a heuristic, not msbuild's incremental
+    /// check: Directory.Build.props/.targets, referenced projects and other inputs (resources,
+    /// content files) are ignored, so a stale DLL can be launched. Only pass true when the caller
+    /// knows those are already built. If the project directory cannot be scanned, the build runs.
+    /// </param>
     public async Task LaunchAsync(string projectPath, string appDllPath,
         bool notifyFirstChanceExceptions = false,
-        CancellationToken ct = default)
+        CancellationToken ct = default,
+        bool skipBuildIfUpToDate = false)
     {
         // Clean up any previous session (terminates the old process and clears module/breakpoint state).
         // Set SuppressExitProcess so the old process's ExitProcess callback does not TryComplete
@@ -119,17 +173,13 @@ public sealed class DotnetDebugger : IAsyncDisposable
         }
 
         // Always recreate the event channel for each new session.
-        _eventChannel = Channel.CreateUnbounded<DebugEvent>(new UnboundedChannelOptions
-        {
-            SingleWriter = true,
-            SingleReader = false,
-            AllowSynchronousContinuations = false
-        });
+        _eventChannel = CreateEventChannel();
         _callbackHandler.BeginNewSession();
         _callbackHandler.UpdateEventWriter(_eventChannel.Writer);
 
-        // Step 1: dotnet build -c Debug
-        await BuildProjectAsync(projectPath, ct);
+        // Step 1: dotnet build -c Debug (a no-op build still costs seconds of msbuild startup)
+        if (!skipBuildIfUpToDate || !IsBuildUpToDate(projectPath, appDllPath))
+            await BuildProjectAsync(projectPath, ct);
 
         // Step 2: Launch under debugger via command channel (must run on debug thread).
         // Set StopAtCreateProcess so the process halts at the CreateProcess event and emits a
@@ -148,6 +198,7 @@ public sealed class DotnetDebugger : IAsyncDisposable
             catch (Exception ex)
             {
                 _callbackHandler.StopAtCreateProcess = false;
+                State = SessionState.Idle;  // no process was created
                 tcs.SetException(ex);
             }
         }, ct);
@@ -222,6 +273,8 @@ public sealed class DotnetDebugger : IAsyncDisposable
             processName = "unknown";
         }
 
+        // DebugActiveProcess does not suspend the target — it keeps running after attach
+        State = SessionState.Running;
         return (confirmedPid, processName);
     }
 
@@ -240,12 +293,7 @@ public sealed class DotnetDebugger : IAsyncDisposable
         await DisconnectAsync(ct);
 
         // Always recreate the event channel for the new session (same as LaunchAsync).
-        _eventChannel = Channel.CreateUnbounded<DebugEvent>(new UnboundedChannelOptions
-        {
-            SingleWriter = true,
-            SingleReader = false,
-            AllowSynchronousContinuations = false
-        });
+        _eventChannel = CreateEventChannel();
         // BeginNewSession increments the session ID before UpdateEventWriter.
         // Any in-flight ExitProcess from a prior attach session will see a mismatched session ID
         // and skip TryComplete — preventing premature channel closure.
@@ -256,17 +304,9 @@ public sealed class DotnetDebugger : IAsyncDisposable
         // Stop at CreateProcess so the caller can set breakpoints before test execution begins.
         _callbackHandler.StopAtCreateProcess = true;
 
-        // Step 1: dotnet build -c Debug
-        var buildPsi = new System.Diagnostics.ProcessStartInfo("dotnet",
-            $"build \"{projectPath}\" -c Debug")
-        {
-            UseShellExecute = false,
-            RedirectStandardOutput = false,
-        };
-        using var buildProc = System.Diagnostics.Process.Start(buildPsi)!;
-        await buildProc.WaitForExitAsync(ct);
-        if (buildProc.ExitCode != 0)
-            throw new InvalidOperationException($"dotnet build failed with exit code {buildProc.ExitCode}");
+        // Step 1: dotnet build -c Debug — same path as LaunchAsync, so the build output is
+        // captured (never written to our stdout, which is the MCP wire) and errors are reported.
+        await BuildProjectAsync(projectPath, ct);
 
         // Step 2: Launch dotnet test with VSTEST_HOST_DEBUG=1
         string testArgs = $"test \"{projectPath}\" --no-build";
@@ -298,17 +338,13 @@ public sealed class DotnetDebugger : IAsyncDisposable
             string? line;
             while ((line = await _dotnetTestProcess.StandardOutput.ReadLineAsync(linkedCts.Token)) != null)
             {
-                var match = System.Text.RegularExpressions.Regex.Match(line, @"Process Id:\s*(\d+)");
-                if (match.Success)
-                {
-                    testhostPid = uint.Parse(match.Groups[1].Value);
+                if (TryParseTesthostPid(line, out testhostPid))
                     break;
-                }
             }
         }
         catch (OperationCanceledException) when (timeoutCts.IsCancellationRequested)
         {
-            _dotnetTestProcess.Kill(entireProcessTree: true);
+            await StopTestRunnerAsync(_dotnetTestProcess, outputDrain: null);
             _dotnetTestProcess = null;
             throw new InvalidOperationException(
                 "Failed to get testhost PID from dotnet test output within 25 seconds. " +
@@ -317,7 +353,7 @@ public sealed class DotnetDebugger : IAsyncDisposable
 
         if (testhostPid == 0)
         {
-            _dotnetTestProcess.Kill(entireProcessTree: true);
+            await StopTestRunnerAsync(_dotnetTestProcess, outputDrain: null);
             _dotnetTestProcess = null;
             throw new InvalidOperationException("Failed to get testhost PID from dotnet test output.");
         }
@@ -328,10 +364,15 @@ public sealed class DotnetDebugger : IAsyncDisposable
         // Drain remaining stdout in background to prevent pipe buffer filling up and blocking
         // the vstest runner process. If the vstest runner blocks on stdout write, it cannot
         // communicate with the testhost via its control channel, causing the testhost to stall.
-        var drainProc = _dotnetTestProcess;
-        _ = Task.Run(async () =>
+        // The loop ends at EOF once the runner exits; StopTestRunnerAsync awaits it before disposing.
+        var drainOutput = _dotnetTestProcess.StandardOutput;
+        _dotnetTestOutputDrain = Task.Run(async () =>
         {
-            try { while (await drainProc.StandardOutput.ReadLineAsync() != null) { } } catch { }
+            try { while (await drainOutput.ReadLineAsync() != null) { } }
+            catch (Exception ex) when (ex is IOException or ObjectDisposedException)
+            {
+                // Stream closed under the read: StopTestRunnerAsync timed out and disposed the runner
+            }
         });
 
         // Step 4: Attach to testhost — reuses all existing attach infrastructure
@@ -358,6 +399,8 @@ public sealed class DotnetDebugger : IAsyncDisposable
         // where a subsequent AttachAsync sees _process != null from the old session and re-disconnects,
         // or where the new session's ContinueAsync runs _process?.Continue(0) on null.
         var tcs = new TaskCompletionSource(TaskCreationOptions.RunContinuationsAsynchronously);
+        System.Diagnostics.Process? testRunner = null;
+        Task? testRunnerDrain = null;
         await DispatchAsync(() =>
         {
             try
@@ -370,20 +413,21 @@ public sealed class DotnetDebugger : IAsyncDisposable
             _corDebug = null;
             _launchedPid = 0;
             _attachPid = 0;
-            // Kill the vstest runner if this was a test session
-            if (_dotnetTestProcess is { HasExited: false })
-            {
-                try { _dotnetTestProcess.Kill(entireProcessTree: true); } catch { }
-            }
+            // Hand the vstest runner (if this was a test session) back to the caller: waiting for
+            // it to exit must not block the debug thread.
+            testRunner = _dotnetTestProcess;
+            testRunnerDrain = _dotnetTestOutputDrain;
             _dotnetTestProcess = null;
+            _dotnetTestOutputDrain = null;
             // Kill the testhost by PID: the testhost is NOT in the Linux process tree of
             // _dotnetTestProcess (vstest spawns it with a different parent), so Kill(entireProcessTree)
-            // above does NOT reach it. Kill it explicitly to prevent zombie testhost accumulation.
+            // on the runner does NOT reach it. Kill it explicitly to prevent zombie testhost accumulation.
             if (_testhostPid != 0)
             {
                 try
                 {
-                    System.Diagnostics.Process.GetProcessById((int)_testhostPid).Kill();
+                    using var testhost = System.Diagnostics.Process.GetProcessById((int)_testhostPid);
+                    testhost.Kill();
                 }
                 catch { /* already exited */ }
                 _testhostPid = 0;
@@ -392,23 +436,103 @@ public sealed class DotnetDebugger : IAsyncDisposable
             {
                 _loadedModules.Clear();
                 _pendingBreakpoints.Clear();
+                _activeBreakpoints.Clear();
             }
-            _activeBreakpoints.Clear();
             _nextBreakpointId = 1;
             _callbackHandler.NotifyFirstChanceExceptions = false;
             _callbackHandler.ClearKnownThreadIds();
             _callbackHandler.ClearBreakpointRegistry();
+            InvalidateStopCaches();
+            MetadataCache.Clear();
+            State = SessionState.Idle;
             tcs.TrySetResult();
         }, ct);
         await tcs.Task.WaitAsync(ct);
+
+        if (testRunner != null)
+            await StopTestRunnerAsync(testRunner, testRunnerDrain);
+    }
+
+    /// <summary>
+    /// Kills the vstest runner, waits (bounded) for it to exit and for its stdout drain to reach
+    /// EOF, then releases the process handle. Best-effort: every session start disconnects first,
+    /// so a failure tearing down the previous runner must never surface to the caller.
+    /// </summary>
+    private static async Task StopTestRunnerAsync(System.Diagnostics.Process runner, Task? outputDrain)
+    {
+        try
+        {
+            runner.Kill(entireProcessTree: true);  // no-op if it has already exited
+        }
+        catch { /* tree already gone or not ours to kill */ }
+
+        try
+        {
+            using var timeoutCts = new CancellationTokenSource(TestRunnerExitTimeout);
+            await runner.WaitForExitAsync(timeoutCts.Token);
+            if (outputDrain != null)
+                await outputDrain.WaitAsync(timeoutCts.Token);
+        }
+        catch
+        {
+            // Runner did not exit in time, or the drain failed — release the handle anyway
+            // rather than stall or fail Disconnect.
+        }
+        finally
+        {
+            runner.Dispose();
+        }
     }
 
     /// <summary>
     /// Waits for the next debug event from the ICorDebug callback thread.
     /// </summary>
-    public async Task<DebugEvent> WaitForEventAsync(CancellationToken ct = default)
+    public Task<DebugEvent> WaitForEventAsync(CancellationToken ct = default)
     {
-        return await _eventChannel.Reader.ReadAsync(ct);
+        if (ct.IsCancellationRequested)
+            return Task.FromCanceled<DebugEvent>(ct);
+
+        // Fast path: events often queue up in bursts (module loads, a breakpoint hit right after
+        // a step) — hand back an already-buffered event without going through the async read.
+        var reader = _eventChannel.Reader;
+        if (reader.TryRead(out DebugEvent? ev))
+        {
+            ApplyEventState(ev);
+            return Task.FromResult(ev);
+        }
+
+        return ReadEventAsync(reader, ct);
+    }
+
+    private async Task<DebugEvent> ReadEventAsync(ChannelReader<DebugEvent> reader, CancellationToken ct)
+    {
+        var ev = await reader.ReadAsync(ct);
+        ApplyEventState(ev);
+        return ev;
+    }
+
+    /// <summary>
+    /// Moves <see cref="State"/> to match a consumed event. Breakpoint, step, pause and exception
+    /// callbacks leave the debuggee suspended; output events do not change the state.
+    /// </summary>
+    private void ApplyEventState(DebugEvent ev)
+    {
+        switch (ev)
+        {
+            case ExitedEvent:
+                State = SessionState.Exited;
+                break;
+            case ExceptionEvent { ExceptionType: "StartupError" }:
+                // Runtime startup failed: no process is attached, LaunchAsync is about to throw
+                State = SessionState.Idle;
+                break;
+            case ExceptionEvent { ExceptionType: "DebuggerError" }:
+                // Reported only — the callback handler continues the process
+                break;
+            case StoppedEvent or BreakpointHitEvent or ExceptionEvent:
+                State = SessionState.Stopped;
+                break;
+        }
     }
 
     // -----------------------------------------------------------------------
@@ -431,7 +555,7 @@ public sealed class DotnetDebugger : IAsyncDisposable
     private void LaunchUnderDebugger(string appDllPath)
     {
         // Create a RuntimeStartupCallback delegate
-        RuntimeStartupCallback callback = OnRuntimeStarted;
+        RuntimeStartupCallback callback = OnRuntimeStartedFromShim;
 
         // CRITICAL: KeepAlive BEFORE RegisterForRuntimeStartup (kernel 6.12+ SIGSEGV fix)
         DbgShimInterop.KeepAlive(callback);
@@ -522,6 +646,24 @@ public sealed class DotnetDebugger : IAsyncDisposable
         }
     }
 
+    /// <summary>
+    /// Launch-path entry point invoked by libdbgshim on its own native thread. An exception
+    /// escaping here would either bring down the server or be lost, leaving LaunchAsync waiting
+    /// on a startup event that never arrives — report it as a StartupError instead.
+    /// </summary>
+    private void OnRuntimeStartedFromShim(IntPtr pCordb, IntPtr parameter, int hr)
+    {
+        try
+        {
+            OnRuntimeStarted(pCordb, parameter, hr);
+        }
+        catch (Exception ex)
+        {
+            _eventChannel.Writer.TryWrite(new ExceptionEvent("StartupError",
+                $"Debugger initialization failed: {ex.Message}", 0, true));
+        }
+    }
+
     private void OnRuntimeStarted(IntPtr pCordb, IntPtr parameter, int hr)
     {
         if (hr != 0)
@@ -572,34 +714,24 @@ public sealed class DotnetDebugger : IAsyncDisposable
 
     private void OnModuleLoaded(ICorDebugModule module)
     {
-        // Get module name — GetName uses IntPtr signature (SYSLIB1051 fix from Plan 02-02)
-        uint nameLen = 256;
-        IntPtr namePtr = Marshal.AllocHGlobal((int)(nameLen * 2));
-        string moduleName;
-        try
-        {
-            module.GetName(nameLen, out _, namePtr);
-            moduleName = Marshal.PtrToStringUni(namePtr) ?? string.Empty;
-        }
-        finally
-        {
-            Marshal.FreeHGlobal(namePtr);
-        }
+        string moduleName = VariableReader.GetModulePath(module);
+        if (moduleName.Length == 0)
+            return;  // unnamed module: cannot match a breakpoint and must not alias other failures
 
         lock (_bpLock)
         {
             _loadedModules[moduleName] = module;
 
             // Resolve any pending breakpoints for this module
-            for (int i = _pendingBreakpoints.Count - 1; i >= 0; i--)
+            // (Dictionary.Remove does not invalidate an in-progress enumeration)
+            foreach (var pending in _pendingBreakpoints.Values)
             {
-                var pending = _pendingBreakpoints[i];
                 if (moduleName.EndsWith(pending.DllName, StringComparison.OrdinalIgnoreCase))
                 {
                     try
                     {
                         ResolveBreakpoint(module, pending.Id, pending.MethodToken, pending.ILOffset);
-                        _pendingBreakpoints.RemoveAt(i);
+                        _pendingBreakpoints.Remove(pending.Id);
                     }
                     catch { /* keep pending — module may load again later */ }
                 }
@@ -617,10 +749,13 @@ public sealed class DotnetDebugger : IAsyncDisposable
         fn.GetILCode(out ICorDebugCode ilCode);
         ilCode.CreateBreakpoint((uint)ilOffset, out ICorDebugFunctionBreakpoint bp);
         bp.Activate(1);  // 1 = enabled
-        _activeBreakpoints[id] = bp;
+        lock (_bpLock)  // re-entrant when called from OnModuleLoaded
+        {
+            _activeBreakpoints[id] = bp;
 
-        // Register for hit reporting: use the stable methodDef token as key
-        _callbackHandler.BreakpointTokenToId[(uint)methodToken] = id;
+            // Register for hit reporting: use the stable methodDef token as key
+            _callbackHandler.BreakpointTokenToId[(uint)methodToken] = id;
+        }
     }
 
     // -----------------------------------------------------------------------
@@ -678,7 +813,7 @@ public sealed class DotnetDebugger : IAsyncDisposable
                     {
                         // Module not loaded yet — queue as pending.
                         // If LoadModule fires after this lock is released, it will find the pending BP.
-                        _pendingBreakpoints.Add(new PendingBreakpoint(id, dllName, methodToken, ilOffset));
+                        _pendingBreakpoints[id] = new PendingBreakpoint(id, dllName, methodToken, ilOffset);
                     }
                 }
 
@@ -702,18 +837,42 @@ public sealed class DotnetDebugger : IAsyncDisposable
     {
         await DispatchAsync(() =>
         {
-            // Remove from active breakpoints
-            if (_activeBreakpoints.TryGetValue(breakpointId, out var bp))
+            // Both maps are shared with the LoadModule callback thread, which resolves pending
+            // breakpoints into _activeBreakpoints (single lookup: Remove hands back the removed value)
+            ICorDebugFunctionBreakpoint? bp;
+            lock (_bpLock)
             {
-                try { bp.Activate(0); } catch { /* ignore if process is gone */ }
-                _activeBreakpoints.Remove(breakpointId);
+                _activeBreakpoints.Remove(breakpointId, out bp);
+                _pendingBreakpoints.Remove(breakpointId);
             }
 
-            // Remove from pending breakpoints
-            _pendingBreakpoints.RemoveAll(p => p.Id == breakpointId);
+            if (bp is not null)
+            {
+                try { bp.Activate(0); } catch { /* ignore if process is gone */ }
+            }
         }, ct);
     }
 
+    /// <summary>
+    /// Extracts the testhost PID from a "Process Id: 12345, Name: testhost" line of dotnet test output.
+    /// Scans the span directly: every output line goes through this while LaunchTestAsync waits for
+    /// the banner, and almost none of them contain the marker.
+    /// </summary>
+    internal static bool TryParseTesthostPid(ReadOnlySpan<char> line, out uint pid)
+    {
+        pid = 0;
+        int markerIdx = line.IndexOf(TesthostPidMarker, StringComparison.Ordinal);
+        if (markerIdx < 0)
+            return false;
+
+        var rest = line[(markerIdx + TesthostPidMarker.Length)..].TrimStart();
+        int digits = 0;
+        while (digits < rest.Length && char.IsAsciiDigit(rest[digits]))
+            digits++;
+
+        return digits > 0 && uint.TryParse(rest[..digits], NumberStyles.None, CultureInfo.InvariantCulture, out pid);
+    }
+
     // -----------------------------------------------------------------------
     // Private: Build
     // -----------------------------------------------------------------------
@@ -730,46 +889,148 @@ public sealed class DotnetDebugger : IAsyncDisposable
         using var buildProcess = Process.Start(psi)
             ?? throw new InvalidOperationException("Failed to start dotnet build");
 
+        // Drain both pipes while the build runs: msbuild writes most of its output to stdout,
+        // and a redirected pipe nobody reads fills up and blocks the child before it can exit.
+        // stdout is scanned line by line as it arrives and only the error lines (plus a short
+        // tail) are kept, so a large solution's build log is never buffered as one string.
+        var stdoutTask = ReadBuildOutputAsync(buildProcess.StandardOutput, ct);
+        var stderrTask = buildProcess.StandardError.ReadToEndAsync(ct);
+
         await buildProcess.WaitForExitAsync(ct);
+        var (errors, tail) = await stdoutTask;
+        string err = await stderrTask;
 
         if (buildProcess.ExitCode != 0)
         {
-            string err = await buildProcess.StandardError.ReadToEndAsync(ct);
-            throw new InvalidOperationException($"dotnet build failed (exit {buildProcess.ExitCode}):\n{err}");
+            // Fall back to the last lines of output when msbuild failed without an error diagnostic
+            IEnumerable<string> lines = errors.Count > 0 ? errors : tail;
+            string details = string.Join("\n", lines);
+            if (!string.IsNullOrWhiteSpace(err))
+                details = details.Length > 0 ? $"{details}\n{err}" : err;
+            throw new InvalidOperationException($"dotnet build failed (exit {buildProcess.ExitCode}):\n{details}");
+        }
+    }
+
+    /// <summary>
+    /// True when <paramref name="appDllPath"/> exists and is newer than every .cs and project file
+    /// under the project directory, skipping bin/, obj/ and symlinked directories (which could form
+    /// a cycle). Stops at the first newer file. Any error scanning the tree counts as out of date.
+    /// </summary>
+    private static bool IsBuildUpToDate(string projectPath, string appDllPath)
+    {
+        try
+        {
+            return IsBuildUpToDateCore(projectPath, appDllPath);
+        }
+        catch (Exception ex) when (ex is IOException or UnauthorizedAccessException
+                                       or System.Security.SecurityException)
+        {
+            return false;
         }
     }
 
+    private static bool IsBuildUpToDateCore(string projectPath, string appDllPath)
+    {
+        var dll = new FileInfo(appDllPath);
+        if (!dll.Exists)
+            return false;
+
+        var projectDir = File.Exists(projectPath)
+            ? new FileInfo(projectPath).Directory
+            : new DirectoryInfo(projectPath);
+        if (projectDir is not { Exists: true })
+            return false;
+
+        var pending = new Stack<DirectoryInfo>();
+        pending.Push(projectDir);
+        while (pending.TryPop(out var dir))
+        {
+            foreach (var entry in dir.EnumerateFileSystemInfos())
+            {
+                if (entry is DirectoryInfo subdir)
+                {
+                    if (!subdir.Name.Equals("bin", StringComparison.OrdinalIgnoreCase)
+                        && !subdir.Name.Equals("obj", StringComparison.OrdinalIgnoreCase)
+                        && !subdir.Attributes.HasFlag(FileAttributes.ReparsePoint))
+                        pending.Push(subdir);
+                }
+                else if ((entry.Extension.Equals(".cs", StringComparison.OrdinalIgnoreCase)
+                          || entry.Extension.EndsWith("proj", StringComparison.OrdinalIgnoreCase))
+                         && entry.LastWriteTimeUtc > dll.LastWriteTimeUtc)
+                {
+                    return false;
+                }
+            }
+        }
+        return true;
+    }
+
+    // Lines of build output kept for the failure message when no error diagnostic was found
+    private const int BuildOutputTailLines = 5;
+
+    /// <summary>
+    /// Reads msbuild output to the end, returning the distinct "error" diagnostic lines in order
+    /// and the last <see cref="BuildOutputTailLines"/> non-empty lines.
+    /// msbuild repeats every diagnostic in its end-of-build summary, hence the de-duplication.
+    /// </summary>
+    private static async Task<(List<string> Errors, Queue<string> Tail)> ReadBuildOutputAsync(
+        StreamReader output, CancellationToken ct)
+    {
+        var errors = new List<string>();
+        var seen = new HashSet<string>(StringComparer.Ordinal);
+        var tail = new Queue<string>(BuildOutputTailLines);
+        while (await output.ReadLineAsync(ct) is { } line)
+        {
+            string trimmed = line.Trim();
+            if (trimmed.Length == 0)
+                continue;
+
+            if (trimmed.Contains(": error ", StringComparison.Ordinal) && seen.Add(trimmed))
+                errors.Add(trimmed);
+
+            if (tail.Count == BuildOutputTailLines)
+                tail.Dequeue();
+            tail.Enqueue(trimmed);
+        }
+        return (errors, tail);
+    }
+
     // -----------------------------------------------------------------------
     // Private: Debug thread loop + command dispatch
     // -----------------------------------------------------------------------
 
     private void DebugThreadLoop()
     {
-        // Block the thread waiting for commands, processing them one at a time
+        // Block the thread waiting for commands, then drain everything already queued
+        // back-to-back before blocking again (bursts of tool calls cost one wait, not N).
         var reader = _commandChannel.Reader;
         while (true)
         {
             // Use GetAwaiter().GetResult() to block synchronously on the thread
             // (this IS the dedicated thread; blocking here is intentional)
-            Action? action = null;
             try
             {
-                var valueTask = reader.ReadAsync();
-                action = valueTask.IsCompleted
-                    ? valueTask.Result
-                    : valueTask.AsTask().GetAwaiter().GetResult();
+                var waitTask = reader.WaitToReadAsync();
+                bool canRead = waitTask.IsCompleted
+                    ? waitTask.Result
+                    : waitTask.AsTask().GetAwaiter().GetResult();
+                if (!canRead)
+                    break;  // command channel completed — exit thread
             }
             catch (ChannelClosedException)
             {
-                break;  // command channel completed — exit thread
+                break;
             }
             catch (OperationCanceledException)
             {
                 break;
             }
 
-            try { action?.Invoke(); }
-            catch (Exception) { /* swallow — action must handle its own errors via TCS */ }
+            while (reader.TryRead(out Action? action))
+            {
+                try { action.Invoke(); }
+                catch (Exception) { /* swallow — action must handle its own errors via TCS */ }
+            }
         }
     }
 
@@ -777,9 +1038,18 @@ public sealed class DotnetDebugger : IAsyncDisposable
     /// Enqueues an action onto the dedicated debug thread and waits for it to be dequeued.
     /// The action runs synchronously on the debug thread.
     /// </summary>
-    private async Task DispatchAsync(Action action, CancellationToken ct)
+    private Task DispatchAsync(Action action, CancellationToken ct)
     {
-        await _commandChannel.Writer.WriteAsync(action, ct);
+        if (ct.IsCancellationRequested)
+            return Task.FromCanceled(ct);
+
+        // The command channel is unbounded, so TryWrite only fails once it has been completed.
+        // Taking the synchronous path skips an async state machine on every tool call;
+        // WriteAsync is kept as the fallback so a closed channel still surfaces its exception.
+        if (_commandChannel.Writer.TryWrite(action))
+            return Task.CompletedTask;
+
+        return _commandChannel.Writer.WriteAsync(action, ct).AsTask();
     }
 
     // -----------------------------------------------------------------------
@@ -796,7 +1066,23 @@ public sealed class DotnetDebugger : IAsyncDisposable
         {
             try
             {
-                _process?.Continue(0);
+                if (_process is not null)
+                {
+                    InvalidateStopCaches();
+                    // Set before Continue so a stop consumed right after resuming is not overwritten;
+                    // restored if Continue fails (e.g. the process has already exited).
+                    var previousState = State;
+                    State = SessionState.Running;
+                    try
+                    {
+                        _process.Continue(0);
+                    }
+                    catch
+                    {
+                        State = previousState;
+                        throw;
+                    }
+                }
                 tcs.TrySetResult();
             }
             catch (Exception ex) { tcs.TrySetException(ex); }
@@ -809,10 +1095,22 @@ public sealed class DotnetDebugger : IAsyncDisposable
     /// </summary>
     public async Task PauseAsync(CancellationToken ct = default)
     {
+        var tcs = new TaskCompletionSource(TaskCreationOptions.RunContinuationsAsynchronously);
         await DispatchAsync(() =>
         {
-            _process?.Stop(0);
+            try
+            {
+                if (_process is not null)
+                {
+                    // Stop() is synchronous and fires no event, so the state is set here
+                    _process.Stop(0);
+                    State = SessionState.Stopped;
+                }
+                tcs.TrySetResult();
+            }
+            catch (Exception ex) { tcs.TrySetException(ex); }
         }, ct);
+        await tcs.Task.WaitAsync(ct);
     }
 
     /// <summary>
@@ -842,6 +1140,8 @@ public sealed class DotnetDebugger : IAsyncDisposable
             stepper.SetInterceptMask(CorDebugIntercept.INTERCEPT_NONE);
             stepper.SetUnmappedStopMask(CorDebugUnmappedStop.STOP_NONE);  // NOT STOP_UNMANAGED
             stepper.StepOut();
+            InvalidateStopCaches();
+            State = SessionState.Running;
             _process.Continue(0);  // Must continue AFTER setting up step
         }, ct);
     }
@@ -858,10 +1158,22 @@ public sealed class DotnetDebugger : IAsyncDisposable
             stepper.SetInterceptMask(CorDebugIntercept.INTERCEPT_NONE);
             stepper.SetUnmappedStopMask(CorDebugUnmappedStop.STOP_NONE);
             stepper.Step(stepIn ? 1 : 0);  // 1=step-into, 0=step-over
+            InvalidateStopCaches();
+            State = SessionState.Running;
             _process.Continue(0);  // Must continue AFTER setting up step
         }, ct);
     }
 
+    /// <summary>
+    /// Drops everything cached for the current stop. Must be called on the debug thread
+    /// before the debuggee resumes — frames and values are only valid while it is stopped.
+    /// </summary>
+    private void InvalidateStopCaches()
+    {
+        _stackFrameCache.Clear();
+        _localsCache.Clear();
+    }
+
     /// <summary>
     /// Gets the first thread from the process thread enumeration.
     /// Must be called on the debug thread.
@@ -926,14 +1238,21 @@ public sealed class DotnetDebugger : IAsyncDisposable
 
     /// <summary>
     /// Walks the chain/frame tree for a single thread. MUST be called on the debug thread.
+    /// A completed walk is cached per thread until the debuggee resumes; a walk cut short by a
+    /// frame error is returned but not cached, so the next request retries it.
     /// </summary>
     private List<StackFrameInfo> GetStackFramesForThread(ICorDebugThread thread)
     {
+        thread.GetID(out uint threadId);
+        if (_stackFrameCache.TryGetValue(threadId, out var cached))
+            return cached;
+
         var frames = new List<StackFrameInfo>();
         // Walk via GetActiveFrame + GetCaller — avoids EnumerateChains COM interop issues.
         thread.GetActiveFrame(out ICorDebugFrame? current);
         int frameIndex = 0;
         const int maxFrames = 64;
+        bool walkFailed = false;
 
         while (current is not null && frameIndex < maxFrames)
         {
@@ -981,8 +1300,14 @@ public sealed class DotnetDebugger : IAsyncDisposable
                 current.GetCaller(out ICorDebugFrame? caller);
                 current = caller;
             }
-            catch { break; }
+            catch
+            {
+                walkFailed = true;
+                break;
+            }
         }
+        if (!walkFailed)
+            _stackFrameCache[threadId] = frames;
         return frames;
     }
 
@@ -1091,6 +1416,13 @@ public sealed class DotnetDebugger : IAsyncDisposable
                 var result = new List<VariableInfo>();
 
                 ICorDebugThread thread = threadId != 0 ? GetThreadById(threadId) : GetCurrentThread();
+                thread.GetID(out uint resolvedThreadId);
+                if (_localsCache.TryGetValue(resolvedThreadId, out var cached))
+                {
+                    tcs.SetResult(cached);
+                    return;
+                }
+
                 thread.GetActiveFrame(out ICorDebugFrame frame);
 
                 if (frame is null || frame is not ICorDebugILFrame ilFrame)
@@ -1106,18 +1438,11 @@ public sealed class DotnetDebugger : IAsyncDisposable
                 fn.GetModule(out ICorDebugModule module);
                 if (module is null) { tcs.SetResult(result); return; }
 
-                uint nameLen = 512;
-                IntPtr namePtr = Marshal.AllocHGlobal((int)(nameLen * 2));
-                string dllPath;
-                try
-                {
-                    module.GetName(nameLen, out _, namePtr);
-                    dllPath = Marshal.PtrToStringUni(namePtr) ?? string.Empty;
-                }
-                finally
-                {
-                    Marshal.FreeHGlobal(namePtr);
-                }
+                string dllPath = VariableReader.ReadModulePath(module);
+
+                // Set by any enumeration step that fails: the partial result is still returned,
+                // but not cached, so the next request for this stop retries the reads.
+                bool readFailed = false;
 
                 // Check if we're in a state machine's MoveNext — if so, read 'this' fields
                 // (C# async variables are stored as fields of the state machine struct, not as IL locals)
@@ -1187,7 +1512,7 @@ public sealed class DotnetDebugger : IAsyncDisposable
                                         objVal.GetFieldValue(cls, fieldToken, out ICorDebugValue fieldVal);
                                         result.Add(VariableReader.ReadValue(displayName, fieldVal));
                                     }
-                                    catch { /* field not available at this IL offset */ }
+                                    catch { readFailed = true; /* field not available at this IL offset */ }
                                 }
                                 // For MoveNext (async state machine), fields ARE the variables — skip IL locals.
                                 // For closure methods (>b__), fields are captured variables but the method also
@@ -1197,7 +1522,7 @@ public sealed class DotnetDebugger : IAsyncDisposable
                             }
                         }
                     }
-                    catch { /* fall through to IL locals */ }
+                    catch { readFailed = true; /* fall through to IL locals */ }
                 }
 
                 if (!readFromStateMachine)
@@ -1205,7 +1530,7 @@ public sealed class DotnetDebugger : IAsyncDisposable
                     // Get local variable names from PDB (slot index → name)
                     Dictionary<int, string> localNames = new();
                     try { localNames = PdbReader.GetLocalNames(dllPath, (int)methodToken); }
-                    catch { }
+                    catch { readFailed = true; }
 
                     // Enumerate locals by index; CORDBG_E_IL_VAR_NOT_AVAILABLE signals end
                     for (uint i = 0; i < 256; i++)
@@ -1222,6 +1547,7 @@ public sealed class DotnetDebugger : IAsyncDisposable
                         }
                         catch
                         {
+                            readFailed = true;
                             break;  // Other errors — stop enumeration
                         }
                     }
@@ -1237,18 +1563,20 @@ public sealed class DotnetDebugger : IAsyncDisposable
                         if (staticFieldMap.Count > 0)
                         {
                             module.GetClassFromToken(declaringTypeToken, out ICorDebugClass staticCls);
-                            thread.GetActiveFrame(out ICorDebugFrame activeFrame);
+                            // Reuse the active frame fetched above — still valid while stopped
                             foreach (var (ft, sfn) in staticFieldMap)
                             {
-                                var sv = VariableReader.ReadStaticField(sfn, staticCls, ft, activeFrame);
-                                if (!sv.Value.Contains("not available"))
+                                var sv = VariableReader.ReadStaticField(sfn, staticCls, ft, frame);
+                                if (sv.Value != VariableReader.NotAvailableValue)
                                     result.Add(sv);
                             }
                         }
                     }
                 }
-                catch { /* static scan is best-effort */ }
+                catch { readFailed = true; /* static scan is best-effort */ }
 
+                if (!readFailed)
+                    _localsCache[resolvedThreadId] = result;
                 tcs.SetResult(result);
             }
             catch (Exception ex) { tcs.SetException(ex); }
@@ -1285,18 +1613,7 @@ public sealed class DotnetDebugger : IAsyncDisposable
                 fn.GetToken(out uint methodToken);
                 fn.GetModule(out ICorDebugModule module);
 
-                uint nameLen = 512;
-                IntPtr namePtr = Marshal.AllocHGlobal((int)(nameLen * 2));
-                string dllPath;
-                try
-                {
-                    module.GetName(nameLen, out _, namePtr);
-                    dllPath = Marshal.PtrToStringUni(namePtr) ?? string.Empty;
-                }
-                finally
-                {
-                    Marshal.FreeHGlobal(namePtr);
-                }
+                string dllPath = VariableReader.ReadModulePath(module);
 
                 // Try "TypeName.FieldName" static field lookup (highest priority)
                 if (expression.Contains('.'))
@@ -1316,8 +1633,7 @@ public sealed class DotnetDebugger : IAsyncDisposable
                             try
                             {
                                 module.GetClassFromToken(foundTypeToken, out ICorDebugClass sfCls);
-                                thread.GetActiveFrame(out ICorDebugFrame activeFrame2);
-                                var sfInfo = VariableReader.ReadStaticField(fieldPart, sfCls, matchEntry.Key, activeFrame2);
+                                var sfInfo = VariableReader.ReadStaticField(fieldPart, sfCls, matchEntry.Key, frame);
                                 tcs.SetResult(new EvalResult(true, sfInfo.Value, null));
                                 return;
                             }
@@ -1,3 +1,4 @@
+using System.Collections.Concurrent;
 using System.Collections.Generic;
 using System.Runtime.InteropServices.Marshalling;
 using System.Threading.Channels;
@@ -23,9 +24,6 @@ internal sealed partial class ManagedCallbackHandler
 {
     private ChannelWriter<DebugEvent> _events;
 
-    // Set from CreateProcess callback; used by DotnetDebugger for ICorDebugProcess access
-    internal ICorDebugProcess? Process { get; private set; }
-
     // Action invoked when CreateProcess fires — DotnetDebugger sets this before launch
     internal Action<ICorDebugProcess>? OnProcessCreated { get; set; }
 
@@ -41,7 +39,9 @@ internal sealed partial class ManagedCallbackHandler
     // comparison (ReferenceEquals) is NOT reliable across callback boundaries. We use the
     // breakpoint's function token as a stable key instead.
     // Key: methodDef token (uint), Value: breakpoint ID assigned by DotnetDebugger.
-    internal Dictionary<uint, int> BreakpointTokenToId { get; } = new();
+    // Concurrent: registered from the debug and LoadModule callback threads, read by Breakpoint
+    // on the callback thread and cleared on disconnect.
+    internal ConcurrentDictionary<uint, int> BreakpointTokenToId { get; } = new();
 
     // Thread ID of the last stopping event (Breakpoint, StepComplete, Break).
     // Used by DotnetDebugger.GetCurrentThread() to call GetThread(id) directly,
@@ -116,7 +116,10 @@ internal sealed partial class ManagedCallbackHandler
             {
                 fbp.GetFunction(out ICorDebugFunction fn);
                 fn.GetToken(out uint token);
-                BreakpointTokenToId.TryGetValue(token, out bpId);
+                // TryGetValue writes default(int) = 0 on a miss, which would turn an unregistered
+                // breakpoint into a hit for ID 0. Only overwrite the -1 sentinel on a real match.
+                if (BreakpointTokenToId.TryGetValue(token, out int registeredId))
+                    bpId = registeredId;
             }
             catch { }
         }
@@ -192,7 +195,6 @@ internal sealed partial class ManagedCallbackHandler
     {
         // Capture the session ID at process creation so ExitProcess can validate it later.
         _processSessionId = _currentSessionId;
-        Process = pProcess;
         OnProcessCreated?.Invoke(pProcess);
 
         if (StopAtCreateProcess)
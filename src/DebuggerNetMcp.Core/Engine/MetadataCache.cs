@@ -0,0 +1,241 @@
+using System.Collections.Generic;
+using System.IO;
+using System.Linq;
+using System.Reflection.Metadata;
+using System.Reflection.PortableExecutable;
+using System.Runtime.InteropServices;
+
+namespace DebuggerNetMcp.Core.Engine;
+
+/// <summary>
+/// Caches parsed PE metadata and Portable PDB readers per assembly path so that repeated
+/// lookups (variable inspection, breakpoint resolution, stack traces) do not reopen and
+/// re-parse the same .dll on every call.
+///
+/// Entries are validated against the file's last write time and length, so a rebuild of the
+/// target project between sessions is picked up on the next lookup. Each entry holds the whole
+/// assembly image, so the cache keeps at most <see cref="MaxEntries"/> assemblies (least recently
+/// used evicted first) and is cleared when a debug session ends.
+///
+/// PDB lookups are never answered from a stale failure: an assembly whose PDB cannot be opened
+/// is evicted (so a PDB-less framework image is not kept alive just for the lookup), and one
+/// without a PDB is only remembered until a .pdb appears next to it or the assembly changes.
+/// </summary>
+internal static class MetadataCache
+{
+    // Stack walks touch framework and test-host assemblies too; keep the working set of one stop.
+    private const int MaxEntries = 32;
+
+    private sealed class Entry(
+        DateTime lastWriteTimeUtc,
+        long length,
+        MetadataReader metadata,
+        Lazy<MetadataReader?> pdbMetadata)
+    {
+        public DateTime LastWriteTimeUtc { get; } = lastWriteTimeUtc;
+        public long Length { get; } = length;
+        public MetadataReader Metadata { get; } = metadata;
+        public Lazy<MetadataReader?> PdbMetadata { get; } = pdbMetadata;
+
+        // Lookup counter value at the last hit; guarded by _lock
+        public long LastUsed { get; set; }
+    }
+
+    // Assembly version (write time + length) last seen without a PDB
+    private sealed record MissingPdb(DateTime LastWriteTimeUtc, long Length);
+
+    private static readonly Dictionary<string, Entry> _entries = new(StringComparer.Ordinal);
+    private static readonly Dictionary<string, MissingPdb> _missingPdbs = new(StringComparer.Ordinal);
+    private static readonly object _lock = new();
+    private static long _useCounter;
+
+    /// <summary>
+    /// Returns the ECMA-335 metadata reader for the assembly at <paramref name="dllPath"/>.
+    /// </summary>
+    /// <exception cref="FileNotFoundException">Thrown when the assembly does not exist.</exception>
+    /// <exception cref="BadImageFormatException">Thrown when the file is not a valid PE image.</exception>
+    public static MetadataReader GetMetadata(string dllPath) => GetEntry(dllPath, GetAssemblyInfo(dllPath)).Metadata;
+
+    /// <summary>
+    /// Returns the Portable PDB metadata reader for the assembly at <paramref name="dllPath"/>,
+    /// using the embedded PDB if present and the associated .pdb file otherwise.
+    /// </summary>
+    /// <exception cref="FileNotFoundException">Thrown when the assembly or its PDB cannot be found.</exception>
+    public static MetadataReader GetPdbMetadata(string dllPath)
+    {
+        var info = GetAssemblyInfo(dllPath);
+        if (IsKnownWithoutPdb(dllPath, info))
+            throw new FileNotFoundException($"PDB not found for {dllPath}");
+
+        var entry = GetEntry(dllPath, info);
+        MetadataReader? pdb;
+        try
+        {
+            pdb = entry.PdbMetadata.Value;
+        }
+        catch
+        {
+            // The Lazy does not cache the failure; evict the image too so the retry starts from disk
+            Evict(dllPath, entry);
+            throw;
+        }
+
+        if (pdb is null)
+        {
+            lock (_lock)
+            {
+                _missingPdbs[dllPath] = new MissingPdb(info.LastWriteTimeUtc, info.Length);
+            }
+            Evict(dllPath, entry);
+            throw new FileNotFoundException($"PDB not found for {dllPath}");
+        }
+        return pdb;
+    }
+
+    /// <summary>
+    /// Drops every cached assembly. Called when a debug session ends so a long-running server
+    /// does not keep images from previous sessions and projects alive.
+    /// </summary>
+    public static void Clear()
+    {
+        lock (_lock)
+        {
+            _entries.Clear();
+            _missingPdbs.Clear();
+        }
+    }
+
+    private static FileInfo GetAssemblyInfo(string dllPath)
+    {
+        var info = new FileInfo(dllPath);
+        if (!info.Exists)
+            throw new FileNotFoundException($"Assembly not found: {dllPath}", dllPath);
+        return info;
+    }
+
+    /// <summary>
+    /// True when this exact assembly version was already found without a PDB and no .pdb has
+    /// appeared next to it since. Costs one stat instead of reloading the image.
+    /// </summary>
+    private static bool IsKnownWithoutPdb(string dllPath, FileInfo info)
+    {
+        MissingPdb? missing;
+        lock (_lock)
+        {
+            if (!_missingPdbs.TryGetValue(dllPath, out missing))
+                return false;
+        }
+
+        if (missing.LastWriteTimeUtc == info.LastWriteTimeUtc
+            && missing.Length == info.Length
+            && !File.Exists(Path.ChangeExtension(dllPath, ".pdb")))
+        {
+            return true;
+        }
+
+        lock (_lock)
+        {
+            _missingPdbs.Remove(dllPath);
+        }
+        return false;
+    }
+
+    private static void Evict(string dllPath, Entry entry)
+    {
+        lock (_lock)
+        {
+            // Only if it was not already replaced by a newer load
+            if (_entries.TryGetValue(dllPath, out var current) && ReferenceEquals(current, entry))
+                _entries.Remove(dllPath);
+        }
+    }
+
+    private static Entry GetEntry(string dllPath, FileInfo info)
+    {
+        lock (_lock)
+        {
+            if (TryGetCurrent(dllPath, info, out var cached))
+                return cached;
+        }
+
+        // Read the whole image into managed memory: the file is not held open or memory-mapped,
+        // so `dotnet build` can overwrite it while a session is still inspecting variables.
+        // The read happens outside the lock so lookups of other assemblies are not stuck behind
+        // disk IO; two threads missing on the same path may both load it, and the first one wins.
+        // Superseded and evicted entries are not disposed — another thread may still be reading
+        // from their MetadataReader — and are reclaimed by the GC once no longer referenced.
+        var image = ImmutableCollectionsMarshal.AsImmutableArray(File.ReadAllBytes(dllPath));
+        var peReader = new PEReader(image);
+        var entry = new Entry(
+            info.LastWriteTimeUtc,
+            info.Length,
+            peReader.GetMetadataReader(),
+            // PublicationOnly: a failed open is not cached, the next lookup tries again
+            new Lazy<MetadataReader?>(() => OpenPdbMetadata(peReader, dllPath),
+                LazyThreadSafetyMode.PublicationOnly));
+
+        lock (_lock)
+        {
+            if (TryGetCurrent(dllPath, info, out var raced))
+                return raced;
+
+            if (!_entries.ContainsKey(dllPath) && _entries.Count >= MaxEntries)
+                EvictLeastRecentlyUsed();
+
+            entry.LastUsed = ++_useCounter;
+            _entries[dllPath] = entry;
+            return entry;
+        }
+    }
+
+    // Must be called under _lock
+    private static bool TryGetCurrent(string dllPath, FileInfo info, out Entry entry)
+    {
+        if (_entries.TryGetValue(dllPath, out entry!)
+            && entry.LastWriteTimeUtc == info.LastWriteTimeUtc
+            && entry.Length == info.Length)
+        {
+            entry.LastUsed = ++_useCounter;
+            return true;
+        }
+        return false;
+    }
+
+    // Must be called under _lock. A linear scan is fine at MaxEntries.
+    private static void EvictLeastRecentlyUsed()
+    {
+        string? oldestPath = null;
+        long oldestUse = long.MaxValue;
+        foreach (var (path, entry) in _entries)
+        {
+            if (entry.LastUsed < oldestUse)
+            {
+                oldestUse = entry.LastUsed;
+                oldestPath = path;
+            }
+        }
+        if (oldestPath != null)
+            _entries.Remove(oldestPath);
+    }
+
+    private static MetadataReader? OpenPdbMetadata(PEReader peReader, string dllPath)
+    {
+        var debugDir = peReader.ReadDebugDirectory();
+
+        // Try embedded PDB first.
+        var embeddedEntry = debugDir.FirstOrDefault(e => e.Type == DebugDirectoryEntryType.EmbeddedPortablePdb);
+        if (embeddedEntry.Type == DebugDirectoryEntryType.EmbeddedPortablePdb)
+        {
+            return peReader.ReadEmbeddedPortablePdbDebugDirectoryData(embeddedEntry).GetMetadataReader();
+        }
+
+        // Try associated .pdb file next (loaded into memory for the same reason as the image).
+        if (peReader.TryOpenAssociatedPortablePdb(dllPath, path => new MemoryStream(File.ReadAllBytes(path)),
+                out var pdbProvider, out _) && pdbProvider != null)
+        {
+            return pdbProvider.GetMetadataReader();
+        }
+
+        return null;
+    }
+}
@@ -37,6 +37,21 @@ public sealed record EvalResult(
     string Value,
     string? ErrorMessage);
 
+/// <summary>
+/// Lifecycle state of the debug session as reported by the MCP tools.
+/// </summary>
+public enum SessionState
+{
+    /// <summary>No session: nothing launched or attached, or the session was disconnected.</summary>
+    Idle,
+    /// <summary>The debuggee is executing.</summary>
+    Running,
+    /// <summary>The debuggee is suspended (process creation, breakpoint, step, pause, or exception).</summary>
+    Stopped,
+    /// <summary>The debuggee process has terminated.</summary>
+    Exited
+}
+
 /// <summary>
 /// Abstract base for all debug events emitted by the debug engine.
 /// Sealed subclasses allow exhaustive pattern matching in switch expressions.
@@ -1,9 +1,7 @@
 using System.Collections.Generic;
 using System.IO;
-using System.Linq;
 using System.Reflection.Metadata;
 using System.Reflection.Metadata.Ecma335;
-using System.Reflection.PortableExecutable;
 
 namespace DebuggerNetMcp.Core.Engine;
 
@@ -25,20 +23,17 @@ internal static class PdbReader
     /// <exception cref="InvalidOperationException">Thrown when no sequence point matches the given file and line.</exception>
     public static (int methodToken, int ilOffset) FindLocation(string dllPath, string sourceFile, int line)
     {
-        using var peReader = new PEReader(File.OpenRead(dllPath));
-
-        using var pdbProvider = OpenPdbProvider(peReader, dllPath);
-        var pdbMetadata = pdbProvider.GetMetadataReader();
+        var pdbMetadata = MetadataCache.GetPdbMetadata(dllPath);
+        var documents = GetMatchingDocuments(pdbMetadata, sourceFile);
 
         foreach (var methodDebugHandle in pdbMetadata.MethodDebugInformation)
         {
             var debugInfo = pdbMetadata.GetMethodDebugInformation(methodDebugHandle);
+            if (!IsInDocuments(debugInfo, documents)) continue;
             foreach (var sp in debugInfo.GetSequencePoints())
             {
                 if (sp.IsHidden) continue;
-                var doc = pdbMetadata.GetDocument(sp.Document);
-                var docName = pdbMetadata.GetString(doc.Name);
-                if (MatchesSourceFile(docName, sourceFile) && sp.StartLine == line)
+                if (sp.StartLine == line && documents.Contains(sp.Document))
                 {
                     int rowNumber = MetadataTokens.GetRowNumber(methodDebugHandle);
                     int methodToken = 0x06000000 | rowNumber;
@@ -63,36 +58,30 @@ internal static class PdbReader
     {
         var results = new List<(int methodToken, int ilOffset)>();
 
-        using var peReader = new PEReader(File.OpenRead(dllPath));
-
-        MetadataReaderProvider? pdbProvider = null;
+        MetadataReader pdbMetadata;
         try
         {
-            pdbProvider = OpenPdbProvider(peReader, dllPath);
+            pdbMetadata = MetadataCache.GetPdbMetadata(dllPath);
         }
         catch (FileNotFoundException)
         {
             return results;
         }
 
-        using (pdbProvider)
-        {
-            var pdbMetadata = pdbProvider.GetMetadataReader();
+        var documents = GetMatchingDocuments(pdbMetadata, sourceFile);
 
-            foreach (var methodDebugHandle in pdbMetadata.MethodDebugInformation)
+        foreach (var methodDebugHandle in pdbMetadata.MethodDebugInformation)
+        {
+            var debugInfo = pdbMetadata.GetMethodDebugInformation(methodDebugHandle);
+            if (!IsInDocuments(debugInfo, documents)) continue;
+            foreach (var sp in debugInfo.GetSequencePoints())
             {
-                var debugInfo = pdbMetadata.GetMethodDebugInformation(methodDebugHandle);
-                foreach (var sp in debugInfo.GetSequencePoints())
+                if (sp.IsHidden) continue;
+                if (sp.StartLine == line && documents.Contains(sp.Document))
                 {
-                    if (sp.IsHidden) continue;
-                    var doc = pdbMetadata.GetDocument(sp.Document);
-                    var docName = pdbMetadata.GetString(doc.Name);
-                    if (MatchesSourceFile(docName, sourceFile) && sp.StartLine == line)
-                    {
-                        int rowNumber = MetadataTokens.GetRowNumber(methodDebugHandle);
-                        int methodToken = 0x06000000 | rowNumber;
-                        results.Add((methodToken, sp.Offset));
-                    }
+                    int rowNumber = MetadataTokens.GetRowNumber(methodDebugHandle);
+                    int methodToken = 0x06000000 | rowNumber;
+                    results.Add((methodToken, sp.Offset));
                 }
             }
         }
@@ -113,9 +102,7 @@ internal static class PdbReader
     {
         try
         {
-            using var peReader = new PEReader(File.OpenRead(dllPath));
-            using var pdbProvider = OpenPdbProvider(peReader, dllPath);
-            var pdbMetadata = pdbProvider.GetMetadataReader();
+            var pdbMetadata = MetadataCache.GetPdbMetadata(dllPath);
 
             int rowNumber = methodToken & 0x00FFFFFF;
             var methodHandle = MetadataTokens.MethodDefinitionHandle(rowNumber);
@@ -154,8 +141,7 @@ internal static class PdbReader
     {
         try
         {
-            using var peReader = new PEReader(File.OpenRead(dllPath));
-            var metadata = peReader.GetMetadataReader();
+            var metadata = MetadataCache.GetMetadata(dllPath);
 
             int rowNumber = methodToken & 0x00FFFFFF;
             var methodHandle = MetadataTokens.MethodDefinitionHandle(rowNumber);
@@ -200,9 +186,7 @@ internal static class PdbReader
 
         try
         {
-            using var peReader = new PEReader(File.OpenRead(dllPath));
-            using var pdbProvider = OpenPdbProvider(peReader, dllPath);
-            var pdbMetadata = pdbProvider.GetMetadataReader();
+            var pdbMetadata = MetadataCache.GetPdbMetadata(dllPath);
 
             // Build the MethodDebugInformationHandle from the method token row number
             int rowNumber = methodToken & 0x00FFFFFF;
@@ -250,8 +234,7 @@ internal static class PdbReader
     {
         try
         {
-            using var peReader = new PEReader(File.OpenRead(dllPath));
-            var metadata = peReader.GetMetadataReader();
+            var metadata = MetadataCache.GetMetadata(dllPath);
             int rowNumber = methodToken & 0x00FFFFFF;
             var methodHandle = MetadataTokens.MethodDefinitionHandle(rowNumber);
             var methodDef = metadata.GetMethodDefinition(methodHandle);
@@ -272,8 +255,7 @@ internal static class PdbReader
     {
         try
         {
-            using var peReader = new PEReader(File.OpenRead(dllPath));
-            var metadata = peReader.GetMetadataReader();
+            var metadata = MetadataCache.GetMetadata(dllPath);
             foreach (var typeHandle in metadata.TypeDefinitions)
             {
                 var typeDef = metadata.GetTypeDefinition(typeHandle);
@@ -290,27 +272,31 @@ internal static class PdbReader
     // Private helpers
     // ---------------------------------------------------------------------------
 
-    private static MetadataReaderProvider OpenPdbProvider(PEReader peReader, string dllPath)
+    /// <summary>
+    /// Returns the handles of every PDB document matching the requested source file.
+    /// Resolving the match once per lookup keeps the sequence-point scan to integer and
+    /// handle comparisons instead of decoding and comparing a document name per point.
+    /// </summary>
+    private static HashSet<DocumentHandle> GetMatchingDocuments(MetadataReader pdbMetadata, string sourceFile)
     {
-        var debugDir = peReader.ReadDebugDirectory();
-
-        // Try embedded PDB first.
-        var embeddedEntry = debugDir.FirstOrDefault(e => e.Type == DebugDirectoryEntryType.EmbeddedPortablePdb);
-        if (embeddedEntry.Type == DebugDirectoryEntryType.EmbeddedPortablePdb)
-        {
-            return peReader.ReadEmbeddedPortablePdbDebugDirectoryData(embeddedEntry);
-        }
-
-        // Try associated .pdb file next.
-        if (peReader.TryOpenAssociatedPortablePdb(dllPath, path => File.OpenRead(path),
-                out var pdbProvider, out _) && pdbProvider != null)
+        var documents = new HashSet<DocumentHandle>();
+        foreach (var documentHandle in pdbMetadata.Documents)
         {
-            return pdbProvider;
+            var doc = pdbMetadata.GetDocument(documentHandle);
+            if (MatchesSourceFile(pdbMetadata.GetString(doc.Name), sourceFile))
+                documents.Add(documentHandle);
         }
-
-        throw new FileNotFoundException($"PDB not found for {dllPath}");
+        return documents;
     }
 
+    /// <summary>
+    /// Returns false when a method's sequence points all live in a single document outside
+    /// <paramref name="documents"/>, so it can be skipped without decoding them.
+    /// Methods spanning several documents (nil Document) are always scanned.
+    /// </summary>
+    private static bool IsInDocuments(MethodDebugInformation debugInfo, HashSet<DocumentHandle> documents)
+        => debugInfo.Document.IsNil || documents.Contains(debugInfo.Document);
+
     /// <summary>
     /// Returns true if the document name from the PDB matches the requested source file.
     /// Handles both full absolute path comparisons and filename-only comparisons.
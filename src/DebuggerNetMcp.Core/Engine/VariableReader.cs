@@ -1,9 +1,7 @@
 using System;
 using System.Collections.Generic;
-using System.IO;
 using System.Reflection.Metadata;
 using System.Reflection.Metadata.Ecma335;
-using System.Reflection.PortableExecutable;
 using System.Runtime.InteropServices;
 using DebuggerNetMcp.Core.Interop;
 
@@ -61,6 +59,9 @@ internal static class VariableReader
     private const int MaxDepth = 3;
     private const uint MaxArrayElements = 10;
 
+    /// <summary>Value reported by <see cref="ReadStaticField"/> when the field cannot be read.</summary>
+    internal const string NotAvailableValue = "<not available>";
+
     /// <summary>
     /// Reads a debug value and returns its human-readable representation.
     /// </summary>
@@ -481,8 +482,7 @@ internal static class VariableReader
                     var instanceFieldNames = new HashSet<string>(
                         ReadInstanceFieldsFromPE(dllPath, typedefToken).Values);
 
-                    using var propPeReader = new PEReader(File.OpenRead(dllPath));
-                    var propMetadata = propPeReader.GetMetadataReader();
+                    var propMetadata = MetadataCache.GetMetadata(dllPath);
                     int rowNum = (int)(typedefToken & 0x00FFFFFF);
                     var propTypeHandle = MetadataTokens.TypeDefinitionHandle(rowNum);
                     var propTypeDef = propMetadata.GetTypeDefinition(propTypeHandle);
@@ -515,8 +515,18 @@ internal static class VariableReader
         }
     }
 
-    /// <summary>Returns the module file path from an ICorDebugModule.</summary>
+    /// <summary>
+    /// Returns the module file path from an ICorDebugModule, or an empty string if GetName fails.
+    /// Callers that cannot continue without the path should use <see cref="ReadModulePath"/>.
+    /// </summary>
     internal static string GetModulePath(ICorDebugModule module)
+    {
+        try { return ReadModulePath(module); }
+        catch { return string.Empty; }
+    }
+
+    /// <summary>Returns the module file path from an ICorDebugModule; GetName failures propagate.</summary>
+    internal static string ReadModulePath(ICorDebugModule module)
     {
         uint nameLen = 512;
         IntPtr namePtr = Marshal.AllocHGlobal((int)(nameLen * 2));
@@ -525,7 +535,6 @@ internal static class VariableReader
             module.GetName(nameLen, out _, namePtr);
             return Marshal.PtrToStringUni(namePtr) ?? string.Empty;
         }
-        catch { return string.Empty; }
         finally { Marshal.FreeHGlobal(namePtr); }
     }
 
@@ -537,8 +546,7 @@ internal static class VariableReader
     {
         try
         {
-            using var peReader = new PEReader(File.OpenRead(dllPath));
-            var metadata = peReader.GetMetadataReader();
+            var metadata = MetadataCache.GetMetadata(dllPath);
             int rowNumber = (int)(typedefToken & 0x00FFFFFF);
             var typeHandle = MetadataTokens.TypeDefinitionHandle(rowNumber);
             var typeDef = metadata.GetTypeDefinition(typeHandle);
@@ -568,8 +576,7 @@ internal static class VariableReader
         var result = new Dictionary<uint, string>();
         try
         {
-            using var peReader = new PEReader(File.OpenRead(dllPath));
-            var metadata = peReader.GetMetadataReader();
+            var metadata = MetadataCache.GetMetadata(dllPath);
             int rowNumber = (int)(typedefToken & 0x00FFFFFF);
             var typeHandle = MetadataTokens.TypeDefinitionHandle(rowNumber);
             var typeDef = metadata.GetTypeDefinition(typeHandle);
@@ -600,8 +607,7 @@ internal static class VariableReader
         var result = new Dictionary<uint, string>();
         try
         {
-            using var peReader = new PEReader(File.OpenRead(dllPath));
-            var metadata = peReader.GetMetadataReader();
+            var metadata = MetadataCache.GetMetadata(dllPath);
             int rowNumber = (int)(typedefToken & 0x00FFFFFF);
             var typeHandle = MetadataTokens.TypeDefinitionHandle(rowNumber);
             var typeDef = metadata.GetTypeDefinition(typeHandle);
@@ -623,7 +629,7 @@ internal static class VariableReader
 
     /// <summary>
     /// Reads a single static field value via ICorDebugClass.GetStaticFieldValue.
-    /// Returns a VariableInfo with "&lt;not available&gt;" if the field cannot be read.
+    /// Returns a VariableInfo with <see cref="NotAvailableValue"/> if the field cannot be read.
     /// </summary>
     internal static VariableInfo ReadStaticField(string name, ICorDebugClass cls, uint fieldToken, ICorDebugFrame? frame)
     {
@@ -634,7 +640,7 @@ internal static class VariableReader
         }
         catch
         {
-            return new VariableInfo(name, "static", "<not available>", Array.Empty<VariableInfo>());
+            return new VariableInfo(name, "static", NotAvailableValue, Array.Empty<VariableInfo>());
         }
     }
 
@@ -643,8 +649,7 @@ internal static class VariableReader
     {
         try
         {
-            using var peReader = new PEReader(File.OpenRead(dllPath));
-            var metadata = peReader.GetMetadataReader();
+            var metadata = MetadataCache.GetMetadata(dllPath);
             int rowNumber = (int)(typedefToken & 0x00FFFFFF);
             var typeHandle = MetadataTokens.TypeDefinitionHandle(rowNumber);
             var typeDef = metadata.GetTypeDefinition(typeHandle);
@@ -665,8 +670,7 @@ internal static class VariableReader
     {
         try
         {
-            using var peReader = new PEReader(File.OpenRead(dllPath));
-            var metadata = peReader.GetMetadataReader();
+            var metadata = MetadataCache.GetMetadata(dllPath);
             int rowNumber = (int)(typedefToken & 0x00FFFFFF);
             var typeHandle = MetadataTokens.TypeDefinitionHandle(rowNumber);
             var typeDef = metadata.GetTypeDefinition(typeHandle);
@@ -707,8 +711,7 @@ internal static class VariableReader
         string typeName = "Enum";
         try
         {
-            using var peReader = new PEReader(File.OpenRead(dllPath));
-            var metadata = peReader.GetMetadataReader();
+            var metadata = MetadataCache.GetMetadata(dllPath);
             int rowNumber = (int)(typedefToken & 0x00FFFFFF);
             var typeHandle = MetadataTokens.TypeDefinitionHandle(rowNumber);
             var typeDef = metadata.GetTypeDefinition(typeHandle);
@@ -78,59 +78,80 @@ internal static class DbgShimInterop
 
     private static nint _libHandle;
 
+    // Guards Load so concurrent DotnetDebugger constructions bind the delegates only once
+    private static readonly object _loadLock = new();
+
     // GC lifetime guard: keeps the RuntimeStartupCallback delegate alive until native code fires it
     private static RuntimeStartupCallback? _startupCallbackRef;
 
     /// <summary>
     /// Loads libdbgshim.so from the first found candidate path and binds all required function delegates.
+    /// The result is process-wide: once a library is loaded, later calls return immediately without
+    /// probing candidates again (a native library cannot be swapped after its exports are bound).
     /// </summary>
     /// <param name="dbgShimPath">Optional explicit path to libdbgshim.so. Takes priority over all other candidates.</param>
     /// <exception cref="FileNotFoundException">Thrown if libdbgshim.so cannot be found in any candidate location.</exception>
     public static void Load(string? dbgShimPath = null)
     {
-        var candidates = BuildCandidateList(dbgShimPath).ToList();
-
-        foreach (var candidate in candidates)
+        lock (_loadLock)
         {
-            if (NativeLibrary.TryLoad(candidate, out _libHandle))
-                break;
+            if (_libHandle != IntPtr.Zero)
+                return;
+
+            BindExports(LoadLibrary(dbgShimPath));
         }
+    }
 
-        if (_libHandle == IntPtr.Zero)
+    private static nint LoadLibrary(string? dbgShimPath)
+    {
+        // Probe lazily: stop at the first candidate that loads instead of enumerating
+        // every runtime directory up front. Attempts are only kept for the error message.
+        var attempted = new List<string>();
+        foreach (var candidate in BuildCandidateList(dbgShimPath))
         {
-            throw new FileNotFoundException(
-                $"Could not load libdbgshim.so. Attempted paths:\n{string.Join("\n", candidates)}");
+            attempted.Add(candidate);
+            if (NativeLibrary.TryLoad(candidate, out nint handle))
+                return handle;
         }
 
+        throw new FileNotFoundException(
+            $"Could not load libdbgshim.so. Attempted paths:\n{string.Join("\n", attempted)}");
+    }
+
+    private static void BindExports(nint libHandle)
+    {
         RegisterForRuntimeStartup = Marshal.GetDelegateForFunctionPointer<RegisterForRuntimeStartupDelegate>(
-            NativeLibrary.GetExport(_libHandle, "RegisterForRuntimeStartup"));
+            NativeLibrary.GetExport(libHandle, "RegisterForRuntimeStartup"));
 
         // Try to bind the v3 API (available in .NET 6+ era libdbgshim)
-        if (NativeLibrary.TryGetExport(_libHandle, "RegisterForRuntimeStartup3", out IntPtr startup3Ptr))
+        if (NativeLibrary.TryGetExport(libHandle, "RegisterForRuntimeStartup3", out IntPtr startup3Ptr))
         {
             RegisterForRuntimeStartup3 = Marshal.GetDelegateForFunctionPointer<RegisterForRuntimeStartup3Delegate>(startup3Ptr);
         }
 
         CreateProcessForLaunch = Marshal.GetDelegateForFunctionPointer<CreateProcessForLaunchDelegate>(
-            NativeLibrary.GetExport(_libHandle, "CreateProcessForLaunch"));
+            NativeLibrary.GetExport(libHandle, "CreateProcessForLaunch"));
 
         ResumeProcess = Marshal.GetDelegateForFunctionPointer<ResumeProcessDelegate>(
-            NativeLibrary.GetExport(_libHandle, "ResumeProcess"));
+            NativeLibrary.GetExport(libHandle, "ResumeProcess"));
 
         CloseResumeHandle = Marshal.GetDelegateForFunctionPointer<CloseResumeHandleDelegate>(
-            NativeLibrary.GetExport(_libHandle, "CloseResumeHandle"));
+            NativeLibrary.GetExport(libHandle, "CloseResumeHandle"));
 
         EnumerateCLRs = Marshal.GetDelegateForFunctionPointer<EnumerateCLRsDelegate>(
-            NativeLibrary.GetExport(_libHandle, "EnumerateCLRs"));
+            NativeLibrary.GetExport(libHandle, "EnumerateCLRs"));
 
         CloseCLREnumeration = Marshal.GetDelegateForFunctionPointer<CloseCLREnumerationDelegate>(
-            NativeLibrary.GetExport(_libHandle, "CloseCLREnumeration"));
+            NativeLibrary.GetExport(libHandle, "CloseCLREnumeration"));
 
         CreateVersionStringFromModule = Marshal.GetDelegateForFunctionPointer<CreateVersionStringFromModuleDelegate>(
-            NativeLibrary.GetExport(_libHandle, "CreateVersionStringFromModule"));
+            NativeLibrary.GetExport(libHandle, "CreateVersionStringFromModule"));
 
         CreateDebuggingInterfaceFromVersionEx = Marshal.GetDelegateForFunctionPointer<CreateDebuggingInterfaceFromVersionExDelegate>(
-            NativeLibrary.GetExport(_libHandle, "CreateDebuggingInterfaceFromVersionEx"));
+            NativeLibrary.GetExport(libHandle, "CreateDebuggingInterfaceFromVersionEx"));
+
+        // Publish last: a partially bound library must not short-circuit the next Load call
+        _libHandle = libHandle;
     }
 
     /// <summary>
@@ -186,14 +207,13 @@ internal static class DbgShimInterop
         if (!Directory.Exists(runtimeBaseDir))
             yield break;
 
-        var subdirs = Directory.GetDirectories(runtimeBaseDir)
-            .OrderByDescending(d => d)
-            .ToList();
-
-        foreach (var subdir in subdirs)
+        // Most runtime directories do not ship libdbgshim.so (it comes from the NuGet package),
+        // so only yield paths that exist: a stat is far cheaper than a failed dlopen per version.
+        foreach (var subdir in Directory.GetDirectories(runtimeBaseDir).OrderByDescending(d => d))
         {
             var candidate = Path.Combine(subdir, "libdbgshim.so");
-            yield return candidate;
+            if (File.Exists(candidate))
+                yield return candidate;
         }
     }
 }
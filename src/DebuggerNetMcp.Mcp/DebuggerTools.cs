@@ -7,13 +7,22 @@ using DebuggerNetMcp.Core.Engine;
 [McpServerToolType]
 public sealed class DebuggerTools(DotnetDebugger debugger)
 {
-    private string _state = "idle";  // idle | running | stopped | exited
     private const string ServerVersion = "0.9.1";
 
     // -----------------------------------------------------------------------
     // Private helpers
     // -----------------------------------------------------------------------
 
+    // Wire names are fixed strings so serialization never goes through Enum.ToString()
+    private static string StateName(SessionState state) => state switch
+    {
+        SessionState.Idle    => "idle",
+        SessionState.Running => "running",
+        SessionState.Stopped => "stopped",
+        SessionState.Exited  => "exited",
+        _                    => "unknown"
+    };
+
     private static object SerializeEvent(DebugEvent ev) => ev switch
     {
         StoppedEvent e       => new { type = "stopped",       reason = e.Reason, threadId = e.ThreadId, topFrame = (object?)e.TopFrame },
@@ -41,10 +50,8 @@ public sealed class DebuggerTools(DotnetDebugger debugger)
         try
         {
             await operation();
-            _state = "running";
             var ev = await debugger.WaitForEventAsync(cts.Token);
-            _state = ev is ExitedEvent ? "exited" : "stopped";
-            return JsonSerializer.Serialize(new { success = true, state = _state, @event = SerializeEvent(ev) });
+            return JsonSerializer.Serialize(new { success = true, state = StateName(debugger.State), @event = SerializeEvent(ev) });
         }
         catch (OperationCanceledException) when (!ct.IsCancellationRequested)
         {
@@ -80,8 +87,7 @@ public sealed class DebuggerTools(DotnetDebugger debugger)
             await debugger.LaunchAsync(projectPath, appDllPath, firstChanceExceptions, cts.Token);
             // LaunchAsync waits for the CreateProcess stopping event, so the process is suspended.
             // The caller should set breakpoints and then call debug_continue.
-            _state = "stopped";
-            return JsonSerializer.Serialize(new { success = true, state = _state });
+            return JsonSerializer.Serialize(new { success = true, state = StateName(debugger.State) });
         }
         catch (Exception ex)
         {
@@ -102,7 +108,6 @@ public sealed class DebuggerTools(DotnetDebugger debugger)
         try
         {
             var (confirmedPid, processName) = await debugger.AttachAsync(processId, cts.Token);
-            _state = "running";
             return JsonSerializer.Serialize(new
             {
                 success = true,
@@ -132,11 +137,10 @@ public sealed class DebuggerTools(DotnetDebugger debugger)
         try
         {
             var (pid, processName) = await debugger.LaunchTestAsync(projectPath, filter, cts.Token);
-            _state = "stopped";
             return JsonSerializer.Serialize(new
             {
                 success = true,
-                state = "stopped",
+                state = StateName(debugger.State),
                 pid,
                 processName,
                 note = "testhost stopped at process creation — set breakpoints then call debug_continue"
@@ -156,8 +160,7 @@ public sealed class DebuggerTools(DotnetDebugger debugger)
         try
         {
             await debugger.DisconnectAsync(cts.Token);
-            _state = "idle";
-            return JsonSerializer.Serialize(new { success = true, state = _state });
+            return JsonSerializer.Serialize(new { success = true, state = StateName(debugger.State) });
         }
         catch (Exception ex)
         {
@@ -168,7 +171,7 @@ public sealed class DebuggerTools(DotnetDebugger debugger)
     [McpServerTool(Name = "debug_status"),
      Description("Returns the current debugger state: idle (no session), running (process running), stopped (at breakpoint or step), or exited (process terminated).")]
     public Task<string> GetStatus(CancellationToken ct) =>
-        Task.FromResult(JsonSerializer.Serialize(new { state = _state, version = ServerVersion }));
+        Task.FromResult(JsonSerializer.Serialize(new { state = StateName(debugger.State), version = ServerVersion }));
 
     // -----------------------------------------------------------------------
     // Breakpoint tools
@@ -244,8 +247,7 @@ public sealed class DebuggerTools(DotnetDebugger debugger)
         try
         {
             await debugger.PauseAsync(cts.Token);
-            _state = "stopped";
-            return JsonSerializer.Serialize(new { success = true, state = _state });
+            return JsonSerializer.Serialize(new { success = true, state = StateName(debugger.State) });
         }
         catch (Exception ex)
         {
@@ -1,5 +1,6 @@
 using System.Diagnostics;
 using DebuggerNetMcp.Core.Engine;
+using static DebuggerNetMcp.Tests.DebuggerTestHelpers;
 
 namespace DebuggerNetMcp.Tests;
 
@@ -8,15 +9,6 @@ public class DebuggerAdvancedTests(DebuggerFixture fixture)
 {
     private DotnetDebugger Dbg => fixture.Debugger;
 
-    // HelloDebug project root (for dotnet build inside LaunchAsync)
-    private static readonly string HelloDebugProject = Path.GetFullPath(
-        Path.Combine(AppContext.BaseDirectory, "..", "..", "..", "..", "HelloDebug"));
-
-    // HelloDebug compiled DLL (Debug build)
-    private static readonly string HelloDebugDll = Path.GetFullPath(
-        Path.Combine(AppContext.BaseDirectory, "..", "..", "..", "..",
-            "HelloDebug", "bin", "Debug", "net10.0", "HelloDebug.dll"));
-
     // ─── Tests ───────────────────────────────────────────────────────────────
 
     [Fact]
@@ -24,25 +16,20 @@ public class DebuggerAdvancedTests(DebuggerFixture fixture)
     {
         using var cts = new CancellationTokenSource(TimeSpan.FromSeconds(30));
 
-        await Dbg.LaunchAsync(HelloDebugProject, HelloDebugDll, ct: cts.Token);
+        await Dbg.LaunchAsync(HelloDebugProject, HelloDebugDll, skipBuildIfUpToDate: true, ct: cts.Token);
 
         // No breakpoints — run until Section 21 throws unhandled InvalidOperationException
         await Dbg.ContinueAsync(cts.Token);
 
         // Wait for the unhandled exception event
-        var exEv = await DebuggerTestHelpers.WaitForSpecificEvent<ExceptionEvent>(Dbg, cts.Token);
+        var exEv = await WaitForSpecificEvent<ExceptionEvent>(Dbg, cts.Token);
 
         Assert.True(exEv.IsUnhandled, "Expected IsUnhandled == true for Section 21 exception");
         Assert.Contains("InvalidOperationException", exEv.ExceptionType);
         Assert.Contains("Section 21 unhandled", exEv.Message);
 
         // Continue once more so the process can exit after the unhandled exception
-        await Dbg.ContinueAsync(cts.Token);
-
-        // Drain remaining events to ExitedEvent
-        await DebuggerTestHelpers.DrainToExit(Dbg, cts.Token);
-
-        await Dbg.DisconnectAsync(cts.Token);
+        await FinishSession(Dbg, cts.Token);
     }
 
     [Fact]
@@ -50,35 +37,22 @@ public class DebuggerAdvancedTests(DebuggerFixture fixture)
     {
         using var cts = new CancellationTokenSource(TimeSpan.FromSeconds(30));
 
-        await Dbg.LaunchAsync(HelloDebugProject, HelloDebugDll, ct: cts.Token);
-
-        // Set BP on Section 20 background thread WriteLine BEFORE continue (line 149)
-        // Process is stopped at CreateProcess so modules aren't loaded yet —
-        // the breakpoint will be pending until the first ContinueAsync triggers LoadModule.
-        await Dbg.SetBreakpointAsync(HelloDebugDll, "Program.cs", 149, cts.Token);
-
-        // Continue past CreateProcess stop — pending BP activates on module load
-        await Dbg.ContinueAsync(cts.Token);
-
-        // Wait for the breakpoint inside the background thread
-        await DebuggerTestHelpers.WaitForSpecificEvent<BreakpointHitEvent>(Dbg, cts.Token);
+        // Break on Section 20 background thread WriteLine (line 149)
+        await LaunchToBreakpoint(Dbg, 149, cts.Token);
 
         // Both main thread and background thread should be visible
         var allThreads = await Dbg.GetAllThreadStackTracesAsync(cts.Token);
         Assert.True(allThreads.Count >= 2,
             $"Expected >= 2 threads at BP-20, got {allThreads.Count}");
 
-        await Dbg.ContinueAsync(cts.Token);
-        await DebuggerTestHelpers.DrainToExit(Dbg, cts.Token);
-
-        await Dbg.DisconnectAsync(cts.Token);
+        await FinishSession(Dbg, cts.Token);
     }
 
     [Fact]
     public async Task PauseAsync_SuspendsAllThreads_NoEventAfterPause()
     {
         using var cts = new CancellationTokenSource(TimeSpan.FromSeconds(30));
-        await Dbg.LaunchAsync(HelloDebugProject, HelloDebugDll, ct: cts.Token);
+        await Dbg.LaunchAsync(HelloDebugProject, HelloDebugDll, skipBuildIfUpToDate: true, ct: cts.Token);
         await Dbg.ContinueAsync(cts.Token); // let process run past CreateProcess stop
 
         await Task.Delay(50, cts.Token);   // give it time to be "running"
@@ -89,9 +63,7 @@ public class DebuggerAdvancedTests(DebuggerFixture fixture)
         Assert.NotEmpty(allThreads); // at least main thread visible
 
         // Resume and drain to exit
-        await Dbg.ContinueAsync(cts.Token);
-        await DebuggerTestHelpers.DrainToExit(Dbg, cts.Token);
-        await Dbg.DisconnectAsync(cts.Token);
+        await FinishSession(Dbg, cts.Token);
     }
 
     [Fact]
@@ -115,7 +87,7 @@ public class DebuggerAdvancedTests(DebuggerFixture fixture)
         await Dbg.SetBreakpointAsync(testsDll, "MathTests.cs", 11, cts.Token);
         await Dbg.ContinueAsync(cts.Token);
 
-        var hit = await DebuggerTestHelpers.WaitForSpecificEvent<BreakpointHitEvent>(Dbg, cts.Token);
+        var hit = await WaitForSpecificEvent<BreakpointHitEvent>(Dbg, cts.Token);
         Assert.NotNull(hit);
 
         var locals = await Dbg.GetLocalsAsync(0, cts.Token);
@@ -123,9 +95,7 @@ public class DebuggerAdvancedTests(DebuggerFixture fixture)
         Assert.NotNull(aVar);
         Assert.Equal("21", aVar.Value);
 
-        await Dbg.ContinueAsync(cts.Token);
-        await DebuggerTestHelpers.DrainToExit(Dbg, cts.Token);
-        await Dbg.DisconnectAsync(cts.Token);
+        await FinishSession(Dbg, cts.Token);
     }
 
     [Fact]
@@ -1,5 +1,6 @@
 using System.Diagnostics;
 using DebuggerNetMcp.Core.Engine;
+using static DebuggerNetMcp.Tests.DebuggerTestHelpers;
 
 namespace DebuggerNetMcp.Tests;
 
@@ -8,15 +9,6 @@ public class DebuggerIntegrationTests(DebuggerFixture fixture)
 {
     private DotnetDebugger Dbg => fixture.Debugger;
 
-    // HelloDebug project root (for dotnet build inside LaunchAsync)
-    private static readonly string HelloDebugProject = Path.GetFullPath(
-        Path.Combine(AppContext.BaseDirectory, "..", "..", "..", "..", "HelloDebug"));
-
-    // HelloDebug compiled DLL (Debug build)
-    private static readonly string HelloDebugDll = Path.GetFullPath(
-        Path.Combine(AppContext.BaseDirectory, "..", "..", "..", "..",
-            "HelloDebug", "bin", "Debug", "net10.0", "HelloDebug.dll"));
-
     // ─── Tests ───────────────────────────────────────────────────────────────
 
     [Fact]
@@ -24,16 +16,8 @@ public class DebuggerIntegrationTests(DebuggerFixture fixture)
     {
         using var cts = new CancellationTokenSource(TimeSpan.FromSeconds(30));
 
-        await Dbg.LaunchAsync(HelloDebugProject, HelloDebugDll, ct: cts.Token);
-
-        // Set breakpoint on Section 1: int counter = 0; (line 17)
-        int bpId = await Dbg.SetBreakpointAsync(HelloDebugDll, "Program.cs", 17, cts.Token);
-
-        // Continue past CreateProcess stop
-        await Dbg.ContinueAsync(cts.Token);
-
-        // Wait for our breakpoint
-        var hit = await DebuggerTestHelpers.WaitForSpecificEvent<BreakpointHitEvent>(Dbg, cts.Token);
+        // Break on Section 1: int counter = 0; (line 17)
+        var (bpId, hit) = await LaunchToBreakpoint(Dbg, 17, cts.Token);
         Assert.Equal(bpId, hit.BreakpointId);
 
         // Inspect locals — counter should be visible with value "0"
@@ -43,10 +27,7 @@ public class DebuggerIntegrationTests(DebuggerFixture fixture)
         Assert.Equal("0", counterVar.Value);
 
         // Let the process finish
-        await Dbg.ContinueAsync(cts.Token);
-        await DebuggerTestHelpers.DrainToExit(Dbg, cts.Token);
-
-        await Dbg.DisconnectAsync(cts.Token);
+        await FinishSession(Dbg, cts.Token);
     }
 
     [Fact]
@@ -54,74 +35,128 @@ public class DebuggerIntegrationTests(DebuggerFixture fixture)
     {
         using var cts = new CancellationTokenSource(TimeSpan.FromSeconds(30));
 
-        await Dbg.LaunchAsync(HelloDebugProject, HelloDebugDll, ct: cts.Token);
-
-        // Set breakpoint on line 17 (int counter = 0;)
-        await Dbg.SetBreakpointAsync(HelloDebugDll, "Program.cs", 17, cts.Token);
-
-        // Continue past CreateProcess stop
-        await Dbg.ContinueAsync(cts.Token);
-
-        // Wait for breakpoint hit
-        await DebuggerTestHelpers.WaitForSpecificEvent<BreakpointHitEvent>(Dbg, cts.Token);
+        // Break on line 17 (int counter = 0;)
+        await LaunchToBreakpoint(Dbg, 17, cts.Token);
 
         // Step over — advances to next line
         await Dbg.StepOverAsync(cts.Token);
-        await DebuggerTestHelpers.WaitForSpecificEvent<StoppedEvent>(Dbg, cts.Token);
+        await WaitForSpecificEvent<StoppedEvent>(Dbg, cts.Token);
 
         // counter variable should still be visible after the step
         var locals = await Dbg.GetLocalsAsync(0, cts.Token);
         Assert.Contains(locals, v => v.Name == "counter");
 
-        await Dbg.ContinueAsync(cts.Token);
-        await DebuggerTestHelpers.DrainToExit(Dbg, cts.Token);
-
-        await Dbg.DisconnectAsync(cts.Token);
+        await FinishSession(Dbg, cts.Token);
     }
 
     [Fact]
-    public async Task LaunchAsync_StepInto_EntersMethod()
+    public async Task StepOver_AfterInspection_ReturnsFreshLocalsAndFrames()
     {
         using var cts = new CancellationTokenSource(TimeSpan.FromSeconds(30));
 
-        await Dbg.LaunchAsync(HelloDebugProject, HelloDebugDll, ct: cts.Token);
+        // Break on Section 3: counter++; (line 34), first loop iteration
+        await LaunchToBreakpoint(Dbg, 34, cts.Token);
 
-        // Set breakpoint on Section 6: int fib = Fibonacci(10); (line 58)
-        await Dbg.SetBreakpointAsync(HelloDebugDll, "Program.cs", 58, cts.Token);
+        // Populate the per-stop caches
+        var before = await Dbg.GetLocalsAsync(0, cts.Token);
+        Assert.Equal("0", before.First(v => v.Name == "counter").Value);
+        var framesBefore = await Dbg.GetStackTraceAsync(0, cts.Token);
+        Assert.Equal(34, framesBefore[0].Line);
 
-        // Continue past CreateProcess stop
-        await Dbg.ContinueAsync(cts.Token);
+        // Step over the increment — the resume must drop the cached locals and frames
+        await Dbg.StepOverAsync(cts.Token);
+        await WaitForSpecificEvent<StoppedEvent>(Dbg, cts.Token);
+
+        var after = await Dbg.GetLocalsAsync(0, cts.Token);
+        Assert.Equal("1", after.First(v => v.Name == "counter").Value);
+        var framesAfter = await Dbg.GetStackTraceAsync(0, cts.Token);
+        Assert.NotEqual(34, framesAfter[0].Line);
+
+        await FinishSession(Dbg, cts.Token);
+    }
+
+    [Fact]
+    public async Task LaunchAsync_StepInto_EntersMethod()
+    {
+        using var cts = new CancellationTokenSource(TimeSpan.FromSeconds(30));
 
-        // Wait for breakpoint hit on Fibonacci call
-        await DebuggerTestHelpers.WaitForSpecificEvent<BreakpointHitEvent>(Dbg, cts.Token);
+        // Break on Section 6: int fib = Fibonacci(10); (line 58)
+        await LaunchToBreakpoint(Dbg, 58, cts.Token);
 
         // Step into Fibonacci()
         await Dbg.StepIntoAsync(cts.Token);
-        await DebuggerTestHelpers.WaitForSpecificEvent<StoppedEvent>(Dbg, cts.Token);
+        await WaitForSpecificEvent<StoppedEvent>(Dbg, cts.Token);
 
         // Should now be inside Fibonacci — stack must have at least 2 frames
         var frames = await Dbg.GetStackTraceAsync(0, cts.Token);
         Assert.True(frames.Count >= 2, $"Expected >= 2 frames after StepInto, got {frames.Count}");
 
-        await Dbg.ContinueAsync(cts.Token);
-        await DebuggerTestHelpers.DrainToExit(Dbg, cts.Token);
-
-        await Dbg.DisconnectAsync(cts.Token);
+        await FinishSession(Dbg, cts.Token);
     }
 
     [Fact]
     public async Task LaunchAsync_NaturalExit_DeliversExitedEvent()
     {
-        using var cts = new CancellationTokenSource(TimeSpan.FromSeconds(30));
+        using var cts = new CancellationTokenSource(TimeSpan.FromSeconds(60));
 
+        // Deliberately runs the real `dotnet build` (the other launches skip it when up to date)
         await Dbg.LaunchAsync(HelloDebugProject, HelloDebugDll, ct: cts.Token);
 
-        // No breakpoints — just let the process run to its unhandled exception / exit
+        // No breakpoints — just let the process run to its unhandled exception / exit.
+        // FinishSession drains OutputEvents and stops when ExitedEvent arrives.
+        await FinishSession(Dbg, cts.Token);
+    }
+
+    [Fact]
+    public async Task LaunchAsync_BuildFailure_ReportsBuildError()
+    {
+        using var cts = new CancellationTokenSource(TimeSpan.FromSeconds(60));
+
+        var missingProject = Path.Combine(Path.GetTempPath(), "DebuggerNetMcp-missing-project");
+        var ex = await Assert.ThrowsAsync<InvalidOperationException>(() =>
+            Dbg.LaunchAsync(missingProject, Path.Combine(missingProject, "Missing.dll"), ct: cts.Token));
+
+        Assert.Contains("dotnet build failed", ex.Message);
+        Assert.Contains("error", ex.Message);
+    }
+
+    [Fact]
+    public async Task State_TracksSessionLifecycle()
+    {
+        using var cts = new CancellationTokenSource(TimeSpan.FromSeconds(30));
+
+        // Without a session, pause/continue are no-ops and must not invent a state
+        await Dbg.DisconnectAsync(cts.Token);
+        await Dbg.PauseAsync(cts.Token);
+        Assert.Equal(SessionState.Idle, Dbg.State);
+        await Dbg.ContinueAsync(cts.Token);
+        Assert.Equal(SessionState.Idle, Dbg.State);
+
+        // A failed launch leaves the debugger idle
+        var missingProject = Path.Combine(Path.GetTempPath(), "DebuggerNetMcp-missing-project");
+        await Assert.ThrowsAsync<InvalidOperationException>(() =>
+            Dbg.LaunchAsync(missingProject, Path.Combine(missingProject, "Missing.dll"), ct: cts.Token));
+        Assert.Equal(SessionState.Idle, Dbg.State);
+
+        await Dbg.LaunchAsync(HelloDebugProject, HelloDebugDll, skipBuildIfUpToDate: true, ct: cts.Token);
+        Assert.Equal(SessionState.Stopped, Dbg.State);  // suspended at process creation
+
+        await Dbg.SetBreakpointAsync(HelloDebugDll, "Program.cs", 17, cts.Token);
+        await Dbg.ContinueAsync(cts.Token);
+        Assert.Equal(SessionState.Running, Dbg.State);
+
+        await WaitForSpecificEvent<BreakpointHitEvent>(Dbg, cts.Token);
+        Assert.Equal(SessionState.Stopped, Dbg.State);
+
         await Dbg.ContinueAsync(cts.Token);
+        await DrainToExit(Dbg, cts.Token);
+        Assert.Equal(SessionState.Exited, Dbg.State);
 
-        // DrainToExit will consume OutputEvents and stop when ExitedEvent arrives
-        await DebuggerTestHelpers.DrainToExit(Dbg, cts.Token);
+        // Continuing a process that has exited fails and must not report "running"
+        await Assert.ThrowsAnyAsync<Exception>(() => Dbg.ContinueAsync(cts.Token));
+        Assert.Equal(SessionState.Exited, Dbg.State);
 
         await Dbg.DisconnectAsync(cts.Token);
+        Assert.Equal(SessionState.Idle, Dbg.State);
     }
 }
@@ -4,6 +4,15 @@ namespace DebuggerNetMcp.Tests;
 
 internal static class DebuggerTestHelpers
 {
+    // HelloDebug project root (for dotnet build inside LaunchAsync)
+    public static readonly string HelloDebugProject = Path.GetFullPath(
+        Path.Combine(AppContext.BaseDirectory, "..", "..", "..", "..", "HelloDebug"));
+
+    // HelloDebug compiled DLL (Debug build)
+    public static readonly string HelloDebugDll = Path.GetFullPath(
+        Path.Combine(AppContext.BaseDirectory, "..", "..", "..", "..",
+            "HelloDebug", "bin", "Debug", "net10.0", "HelloDebug.dll"));
+
     /// <summary>
     /// Drains events until the requested type arrives. Throws if process exits first.
     /// </summary>
@@ -34,4 +43,31 @@ internal static class DebuggerTestHelpers
                 await dbg.ContinueAsync(ct); // keep process running toward exit
         }
     }
+
+    /// <summary>
+    /// Launches HelloDebug, sets a breakpoint on the given Program.cs line while stopped at
+    /// CreateProcess, continues and waits for that breakpoint. Returns the breakpoint ID and hit event.
+    /// </summary>
+    public static async Task<(int BreakpointId, BreakpointHitEvent Hit)> LaunchToBreakpoint(
+        DotnetDebugger dbg, int line, CancellationToken ct)
+    {
+        await dbg.LaunchAsync(HelloDebugProject, HelloDebugDll, skipBuildIfUpToDate: true, ct: ct);
+
+        // Modules are not loaded yet at CreateProcess — the breakpoint stays pending until LoadModule
+        int bpId = await dbg.SetBreakpointAsync(HelloDebugDll, "Program.cs", line, ct);
+        await dbg.ContinueAsync(ct);
+
+        var hit = await WaitForSpecificEvent<BreakpointHitEvent>(dbg, ct);
+        return (bpId, hit);
+    }
+
+    /// <summary>
+    /// Resumes a stopped debuggee, drains events until it exits and disconnects the session.
+    /// </summary>
+    public static async Task FinishSession(DotnetDebugger dbg, CancellationToken ct)
+    {
+        await dbg.ContinueAsync(ct);
+        await DrainToExit(dbg, ct);
+        await dbg.DisconnectAsync(ct);
+    }
 }
@@ -1,12 +1,9 @@
+using static DebuggerNetMcp.Tests.DebuggerTestHelpers;
+
 namespace DebuggerNetMcp.Tests;
 
 public class PdbReaderTests
 {
-    private static readonly string HelloDebugDll = Path.GetFullPath(
-        Path.Combine(AppContext.BaseDirectory,
-            "..", "..", "..", "..",
-            "HelloDebug", "bin", "Debug", "net10.0", "HelloDebug.dll"));
-
     [Fact]
     public void HelloDebugDll_Exists()
     {
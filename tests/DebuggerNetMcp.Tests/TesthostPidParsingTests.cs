@@ -0,0 +1,26 @@
+using DebuggerNetMcp.Core.Engine;
+
+namespace DebuggerNetMcp.Tests;
+
+public class TesthostPidParsingTests
+{
+    [Theory]
+    [InlineData("Process Id: 12345, Name: testhost", 12345u)]
+    [InlineData("Host debugging is enabled. Process Id:4242, Name: testhost", 4242u)]
+    [InlineData("Process Id:   7", 7u)]
+    public void TryParseTesthostPid_BannerLine_ReturnsPid(string line, uint expected)
+    {
+        Assert.True(DotnetDebugger.TryParseTesthostPid(line, out uint pid));
+        Assert.Equal(expected, pid);
+    }
+
+    [Theory]
+    [InlineData("")]
+    [InlineData("Starting test execution, please wait...")]
+    [InlineData("Process Id: , Name: testhost")]
+    [InlineData("Process Id: 99999999999, Name: testhost")]
+    public void TryParseTesthostPid_OtherLine_ReturnsFalse(string line)
+    {
+        Assert.False(DotnetDebugger.TryParseTesthostPid(line, out _));
+    }
+}